@@ -1,14 +1,60 @@
 import tkinter as tk
 from tkinter import ttk, messagebox, simpledialog, filedialog
+from tkinter import font as tkfont
 import sqlite3
 import json
 import os
+import threading
+from bisect import bisect
+from collections import deque
+from contextlib import contextmanager
 from datetime import datetime, timezone
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 DB_PATH = os.path.join(os.path.dirname(__file__), 'quizlet_clone_data.db')
 
+def utcnow_iso():
+    # Not free (~1µs per call); batch paths call it once and reuse the
+    # value for every row.
+    return datetime.now(timezone.utc).isoformat()
+
+def json_dumps(obj):
+    # orjson is several times faster than stdlib json; fall back when
+    # it isn't installed.
+    if orjson is not None:
+        return orjson.dumps(obj).decode('utf-8')
+    return json.dumps(obj, ensure_ascii=False)
+
+def json_load_file(path):
+    if orjson is not None:
+        with open(path, 'rb') as f:
+            return orjson.loads(f.read())
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+def open_conn():
+    # One connection per thread: sqlite3 connections aren't shareable
+    # across threads, so workers open their own with the same setup.
+    conn = sqlite3.connect(DB_PATH, cached_statements=256)
+    # C-backed rows with named column access; cheaper than building
+    # dicts per row and less fragile than positional indexing.
+    conn.row_factory = sqlite3.Row
+    # WAL + relaxed sync avoids a rollback-journal fsync on every commit;
+    # foreign_keys is off by default even though the schema declares
+    # ON DELETE CASCADE, so turn it on here.
+    conn.execute('PRAGMA journal_mode=WAL')
+    conn.execute('PRAGMA synchronous=NORMAL')
+    conn.execute('PRAGMA temp_store=MEMORY')
+    conn.execute('PRAGMA cache_size=-8000')
+    conn.execute('PRAGMA foreign_keys=ON')
+    return conn
+
 def init_db():
-    conn = sqlite3.connect(DB_PATH)
+    conn = open_conn()
     c = conn.cursor()
     c.execute('''
     CREATE TABLE IF NOT EXISTS decks (
@@ -29,88 +75,245 @@ def init_db():
         FOREIGN KEY(deck_id) REFERENCES decks(id) ON DELETE CASCADE
     )
     ''')
+    # Matches both the WHERE and ORDER BY of cards_in_deck, so deck
+    # selection is an index range scan with no sort step.
+    c.execute('CREATE INDEX IF NOT EXISTS idx_cards_deck_id ON cards(deck_id, id)')
     conn.commit()
     return conn
 
 class Model:
+    # Cards per json_each INSERT during import; keeps the serialized
+    # JSON parameter bounded for very large decks.
+    IMPORT_CHUNK = 10000
+
     def __init__(self, conn):
         self.conn = conn
+        self._batch_depth = 0
+
+    @contextmanager
+    def batch(self):
+        # Group several mutating calls into one transaction; individual
+        # methods skip their commit while a batch is open.
+        self._batch_depth += 1
+        try:
+            yield
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0:
+                self.conn.commit()
+
+    def _commit(self):
+        if self._batch_depth == 0:
+            self.conn.commit()
 
     def all_decks(self):
-        c = self.conn.cursor()
-        c.execute('SELECT id, name FROM decks ORDER BY name')
-        return c.fetchall()
+        return self.conn.execute('SELECT id, name FROM decks ORDER BY name').fetchall()
+
+    def get_deck(self, deck_id):
+        return self.conn.execute('SELECT id, name FROM decks WHERE id=?', (deck_id,)).fetchone()
 
     def add_deck(self, name):
-        c = self.conn.cursor()
-        c.execute('INSERT INTO decks (name, created_at) VALUES (?, ?)', (name, datetime.now(timezone.utc).isoformat()))
-        self.conn.commit()
+        c = self.conn.execute('INSERT INTO decks (name, created_at) VALUES (?, ?)', (name, utcnow_iso()))
+        self._commit()
         return c.lastrowid
 
     def rename_deck(self, deck_id, new_name):
-        c = self.conn.cursor()
-        c.execute('UPDATE decks SET name=? WHERE id=?', (new_name, deck_id))
-        self.conn.commit()
+        self.conn.execute('UPDATE decks SET name=? WHERE id=?', (new_name, deck_id))
+        self._commit()
 
     def delete_deck(self, deck_id):
-        c = self.conn.cursor()
-        c.execute('DELETE FROM cards WHERE deck_id=?', (deck_id,))
-        c.execute('DELETE FROM decks WHERE id=?', (deck_id,))
-        self.conn.commit()
+        # foreign_keys=ON makes the ON DELETE CASCADE on cards fire, so
+        # one indexed cascade replaces the explicit two-statement delete.
+        self.conn.execute('DELETE FROM decks WHERE id=?', (deck_id,))
+        self._commit()
 
     def cards_in_deck(self, deck_id):
-        c = self.conn.cursor()
-        c.execute('SELECT id, front, back, correct_count, seen_count FROM cards WHERE deck_id=? ORDER BY id', (deck_id,))
-        return c.fetchall()
+        # Only (id, label) per row — full card text stays in the DB and
+        # is fetched on demand, so list memory is bounded by the preview
+        # length rather than total card content. The label is assembled
+        # in C during the SELECT instead of per-row Python string work.
+        return self.conn.execute(
+            "SELECT id, substr(replace(coalesce(front, ''), char(10), ' '), 1, 60)"
+            " || ' (✓' || correct_count || ' / seen ' || seen_count || ')' AS label"
+            " FROM cards WHERE deck_id=? ORDER BY id", (deck_id,)).fetchall()
+
+    def get_card(self, card_id):
+        return self.conn.execute('SELECT front, back, correct_count, seen_count FROM cards WHERE id=?', (card_id,)).fetchone()
+
+    def card_row(self, card_id):
+        # Single-row twin of the cards_in_deck query, for patching the
+        # list view in place after a mutation.
+        return self.conn.execute(
+            "SELECT id, substr(replace(coalesce(front, ''), char(10), ' '), 1, 60)"
+            " || ' (✓' || correct_count || ' / seen ' || seen_count || ')' AS label"
+            " FROM cards WHERE id=?", (card_id,)).fetchone()
+
+    def study_cards(self, deck_id):
+        return self.conn.execute('SELECT id, front, back FROM cards WHERE deck_id=? ORDER BY id', (deck_id,)).fetchall()
 
     def add_card(self, deck_id, front, back):
-        c = self.conn.cursor()
-        c.execute('INSERT INTO cards (deck_id, front, back, created_at) VALUES (?, ?, ?, ?)', (deck_id, front, back, datetime.now(timezone.utc).isoformat()))
-        self.conn.commit()
+        c = self.conn.execute('INSERT INTO cards (deck_id, front, back, created_at) VALUES (?, ?, ?, ?)', (deck_id, front, back, utcnow_iso()))
+        self._commit()
         return c.lastrowid
 
     def update_card(self, card_id, front, back):
-        c = self.conn.cursor()
-        c.execute('UPDATE cards SET front=?, back=? WHERE id=?', (front, back, card_id))
-        self.conn.commit()
+        self.conn.execute('UPDATE cards SET front=?, back=? WHERE id=?', (front, back, card_id))
+        self._commit()
 
     def delete_card(self, card_id):
-        c = self.conn.cursor()
-        c.execute('DELETE FROM cards WHERE id=?', (card_id,))
-        self.conn.commit()
+        self.conn.execute('DELETE FROM cards WHERE id=?', (card_id,))
+        self._commit()
 
     def record_result(self, card_id, correct):
-        c = self.conn.cursor()
         if correct:
-            c.execute('UPDATE cards SET correct_count = correct_count + 1, seen_count = seen_count + 1 WHERE id=?', (card_id,))
+            self.conn.execute('UPDATE cards SET correct_count = correct_count + 1, seen_count = seen_count + 1 WHERE id=?', (card_id,))
         else:
-            c.execute('UPDATE cards SET seen_count = seen_count + 1 WHERE id=?', (card_id,))
-        self.conn.commit()
+            self.conn.execute('UPDATE cards SET seen_count = seen_count + 1 WHERE id=?', (card_id,))
+        self._commit()
+
+    def record_results_bulk(self, results):
+        # results is a list of (card_id, correct) pairs; one transaction
+        # for the whole study session instead of one commit per review.
+        with self.batch():
+            self.conn.executemany(
+                'UPDATE cards SET correct_count = correct_count + ?, seen_count = seen_count + 1 WHERE id=?',
+                [(1 if correct else 0, card_id) for card_id, correct in results])
 
     def export_deck_json(self, deck_id, path):
-        c = self.conn.cursor()
-        c.execute('SELECT name FROM decks WHERE id=?', (deck_id,))
-        row = c.fetchone()
+        row = self.conn.execute('SELECT name FROM decks WHERE id=?', (deck_id,)).fetchone()
         if not row:
             raise ValueError('Deck not found')
         deck_name = row[0]
-        c.execute('SELECT front, back, correct_count, seen_count, created_at FROM cards WHERE deck_id=?', (deck_id,))
-        cards = [dict(front=r[0], back=r[1], correct_count=r[2], seen_count=r[3], created_at=r[4]) for r in c.fetchall()]
-        payload = dict(name=deck_name, exported_at=datetime.now(timezone.utc).isoformat(), cards=cards)
+        # Let SQLite build the cards array as JSON text directly; no
+        # per-row Python dict construction or re-encode pass.
+        c = self.conn.execute("""
+            SELECT json_group_array(json_object(
+                'front', front, 'back', back,
+                'correct_count', correct_count, 'seen_count', seen_count,
+                'created_at', created_at))
+            FROM cards WHERE deck_id=?
+        """, (deck_id,))
+        cards_json = c.fetchone()[0] or '[]'
         with open(path, 'w', encoding='utf-8') as f:
-            json.dump(payload, f, ensure_ascii=False, indent=2)
+            f.write('{"name": %s, "exported_at": %s, "cards": %s}' % (
+                json_dumps(deck_name),
+                json_dumps(utcnow_iso()),
+                cards_json))
 
     def import_deck_json(self, path):
-        with open(path, 'r', encoding='utf-8') as f:
-            payload = json.load(f)
-        name = payload.get('name') or f'Deck {datetime.now(timezone.utc).isoformat()}'
-        deck_id = self.add_deck(name)
-        for card in payload.get('cards', []):
-            self.add_card(deck_id, card.get('front',''), card.get('back',''))
+        payload = json_load_file(path)
+        now_iso = utcnow_iso()
+        name = payload.get('name') or f'Deck {now_iso}'
+        cards = payload.get('cards', [])
+        with self.batch():
+            deck_id = self.add_deck(name)
+            # Hand the cards to SQLite and let json_each unpack them:
+            # one prepared statement, a C-level loop, no per-row
+            # parameter binding from Python. Very large decks go in
+            # IMPORT_CHUNK slices so the JSON parameter (and its
+            # re-encode) never balloons, while staying in the same
+            # single transaction.
+            for start in range(0, len(cards), self.IMPORT_CHUNK):
+                self.conn.execute(
+                    "INSERT INTO cards (deck_id, front, back, created_at) "
+                    "SELECT ?, coalesce(json_extract(value, '$.front'), ''), "
+                    "coalesce(json_extract(value, '$.back'), ''), ? FROM json_each(?)",
+                    (deck_id, now_iso, json_dumps(cards[start:start + self.IMPORT_CHUNK])))
         return deck_id
 
 
 
+class VirtualListbox(ttk.Frame):
+    # A Listbox that only materializes the visible slice of its items,
+    # simulating a full-length scrollbar. Display strings are produced
+    # lazily by a formatter, so both Tk work and formatting cost scale
+    # with the viewport instead of the item count.
+    BUFFER = 10
+
+    def __init__(self, master, **listbox_opts):
+        super().__init__(master)
+        self.items = []
+        self.formatter = str
+        self._first = 0
+        self._select_cb = None
+        self.listbox = tk.Listbox(self, **listbox_opts)
+        self.listbox.pack(side='left', fill='both', expand=True)
+        self.scrollbar = ttk.Scrollbar(self, orient='vertical', command=self._scroll)
+        self.scrollbar.pack(side='right', fill='y')
+        self.listbox.bind('<<ListboxSelect>>', self._on_select)
+        self.listbox.bind('<MouseWheel>', self._on_mousewheel)
+        self.listbox.bind('<Button-4>', lambda e: self._wheel_step(-3))
+        self.listbox.bind('<Button-5>', lambda e: self._wheel_step(3))
+        self.listbox.bind('<Configure>', lambda e: self._render())
+
+    def set_items(self, items, formatter=None):
+        self.items = items
+        if formatter is not None:
+            self.formatter = formatter
+        self._first = 0
+        self._render()
+
+    def append(self, item):
+        self.items.append(item)
+        self._render()
+
+    def update_item(self, index, item):
+        self.items[index] = item
+        self._render()
+
+    def delete_item(self, index):
+        self.items.pop(index)
+        self._render()
+
+    def curselection(self):
+        # Translate rendered-slice indices back to absolute ones.
+        return tuple(self._first + i for i in self.listbox.curselection())
+
+    def bind_select(self, callback):
+        self._select_cb = callback
+
+    def _visible_rows(self):
+        try:
+            row_h = tkfont.Font(font=self.listbox.cget('font')).metrics('linespace')
+        except tk.TclError:
+            row_h = 16
+        return max(self.listbox.winfo_height() // max(row_h, 1), 1)
+
+    def _render(self):
+        n = len(self.items)
+        visible = self._visible_rows()
+        self._first = max(min(self._first, n - visible), 0)
+        last = min(self._first + visible + self.BUFFER, n)
+        self.listbox.delete(0, tk.END)
+        for item in self.items[self._first:last]:
+            self.listbox.insert(tk.END, self.formatter(item))
+        if n:
+            self.scrollbar.set(self._first / n, min(last / n, 1.0))
+        else:
+            self.scrollbar.set(0.0, 1.0)
+
+    def _scroll(self, action, amount, unit=None):
+        if action == 'moveto':
+            self._first = int(float(amount) * len(self.items))
+        elif action == 'scroll':
+            step = self._visible_rows() if unit == 'pages' else 1
+            self._first += int(amount) * step
+        self._render()
+
+    def _wheel_step(self, step):
+        self._scroll('scroll', step, 'units')
+        # Swallow the Listbox class binding, which would also scroll the
+        # rendered slice and desync the viewport from _first.
+        return 'break'
+
+    def _on_mousewheel(self, event):
+        return self._wheel_step(-3 if event.delta > 0 else 3)
+
+    def _on_select(self, evt):
+        if self._select_cb:
+            self._select_cb(evt)
+
+
 class App(tk.Tk):
     def __init__(self, model):
         super().__init__()
@@ -119,6 +322,7 @@ class App(tk.Tk):
         self.model = model
         self.selected_deck_id = None
         self.selected_card_id = None
+        self.selected_card_index = None
         self.study_queue = []
 
         self.create_widgets()
@@ -131,7 +335,9 @@ class App(tk.Tk):
         filemenu.add_command(label='Import deck (JSON)...', command=self.import_deck)
         filemenu.add_command(label='Export selected deck (JSON)...', command=self.export_deck)
         filemenu.add_separator()
-        filemenu.add_command(label='Exit', command=self.quit)
+        # destroy (not quit) so an open StudyWindow is torn down and
+        # flushes its pending results before the mainloop returns.
+        filemenu.add_command(label='Exit', command=self.destroy)
         menubar.add_cascade(label='File', menu=filemenu)
         studymenu = tk.Menu(menubar, tearoff=0)
         studymenu.add_command(label='Start study of selected deck', command=self.start_study)
@@ -159,9 +365,9 @@ class App(tk.Tk):
 
 
         ttk.Label(middle, text='Cards in deck').pack(anchor='w')
-        self.cards_list = tk.Listbox(middle)
+        self.cards_list = VirtualListbox(middle)
         self.cards_list.pack(fill='both', expand=True)
-        self.cards_list.bind('<<ListboxSelect>>', self.on_card_select)
+        self.cards_list.bind_select(self.on_card_select)
 
 
         ttk.Label(right, text='Card editor').pack(anchor='w')
@@ -182,13 +388,20 @@ class App(tk.Tk):
         self.decks_list.delete(0, tk.END)
         self.decks = self.model.all_decks()
         for deck in self.decks:
-            self.decks_list.insert(tk.END, deck[1])
+            self.decks_list.insert(tk.END, deck['name'])
+
+    def insert_deck_row(self, row):
+        # Splice one deck into the list at its sorted position instead
+        # of re-querying and repopulating everything.
+        i = bisect([d['name'] for d in self.decks], row['name'])
+        self.decks.insert(i, row)
+        self.decks_list.insert(i, row['name'])
 
     def add_deck(self):
         name = simpledialog.askstring('New deck', 'Deck name:')
         if name:
-            self.model.add_deck(name)
-            self.load_decks()
+            deck_id = self.model.add_deck(name)
+            self.insert_deck_row(self.model.get_deck(deck_id))
 
     def rename_deck(self):
         sel = self.decks_list.curselection()
@@ -200,7 +413,9 @@ class App(tk.Tk):
         new_name = simpledialog.askstring('Rename deck', 'New name:', initialvalue=deck_name)
         if new_name:
             self.model.rename_deck(deck_id, new_name)
-            self.load_decks()
+            self.decks.pop(i)
+            self.decks_list.delete(i)
+            self.insert_deck_row(self.model.get_deck(deck_id))
 
     def delete_deck(self):
         sel = self.decks_list.curselection()
@@ -212,39 +427,43 @@ class App(tk.Tk):
         if messagebox.askyesno('Delete', f'Delete deck "{deck_name}" and all its cards?'):
             self.model.delete_deck(deck_id)
             self.selected_deck_id = None
+            self.selected_card_id = None
+            self.selected_card_index = None
             self.load_decks()
-            self.cards_list.delete(0, tk.END)
+            self.cards_list.set_items([])
 
     def on_deck_select(self, evt=None):
         sel = self.decks_list.curselection()
         if not sel:
             return
         i = sel[0]
-        self.selected_deck_id = self.decks[i][0]
+        self.selected_deck_id = self.decks[i]['id']
         self.load_cards(self.selected_deck_id)
 
     # ---------- Card actions ----------
     def load_cards(self, deck_id):
-        self.cards_list.delete(0, tk.END)
         self.cards = self.model.cards_in_deck(deck_id)
-        for c in self.cards:
-            # show front (shortened)
-            front = c[1] or ''
-            preview = front.replace('\n', ' ')[:60]
-            stats = f" (✓{c[3]} / seen {c[4]})"
-            self.cards_list.insert(tk.END, preview + stats)
+        self.cards_list.set_items(self.cards, self.card_label)
+        # Any previous selection points into the old list; a stale index
+        # would patch (or pop) the wrong row on update/delete.
+        self.selected_card_id = None
+        self.selected_card_index = None
+
+    def card_label(self, c):
+        return c['label']
 
     def on_card_select(self, evt=None):
         sel = self.cards_list.curselection()
         if not sel:
             return
         i = sel[0]
-        card = self.cards[i]
-        self.selected_card_id = card[0]
+        self.selected_card_id = self.cards[i]['id']
+        self.selected_card_index = i
+        card = self.model.get_card(self.selected_card_id)
         self.front_text.delete('1.0', tk.END)
-        self.front_text.insert('1.0', card[1] or '')
+        self.front_text.insert('1.0', card['front'] or '')
         self.back_text.delete('1.0', tk.END)
-        self.back_text.insert('1.0', card[2] or '')
+        self.back_text.insert('1.0', card['back'] or '')
 
     def add_card(self):
         if not self.selected_deck_id:
@@ -255,26 +474,30 @@ class App(tk.Tk):
         if not front and not back:
             messagebox.showinfo('Info', 'Card is empty')
             return
-        self.model.add_card(self.selected_deck_id, front, back)
-        self.load_cards(self.selected_deck_id)
+        new_id = self.model.add_card(self.selected_deck_id, front, back)
+        # self.cards is the same list the widget renders, so one append
+        # keeps both in sync — no re-SELECT, no full repopulate.
+        self.cards_list.append(self.model.card_row(new_id))
 
     def update_card(self):
-        if not self.selected_card_id:
+        if self.selected_card_id is None or self.selected_card_index is None:
             messagebox.showinfo('Info', 'Select a card first')
             return
         front = self.front_text.get('1.0', tk.END).strip()
         back = self.back_text.get('1.0', tk.END).strip()
         self.model.update_card(self.selected_card_id, front, back)
-        self.load_cards(self.selected_deck_id)
+        i = self.selected_card_index
+        self.cards_list.update_item(i, self.model.card_row(self.selected_card_id))
 
     def delete_card(self):
-        if not self.selected_card_id:
+        if self.selected_card_id is None or self.selected_card_index is None:
             messagebox.showinfo('Info', 'Select a card first')
             return
         if messagebox.askyesno('Delete', 'Delete selected card?'):
             self.model.delete_card(self.selected_card_id)
+            self.cards_list.delete_item(self.selected_card_index)
             self.selected_card_id = None
-            self.load_cards(self.selected_deck_id)
+            self.selected_card_index = None
 
 
     def export_deck(self):
@@ -284,22 +507,38 @@ class App(tk.Tk):
         path = filedialog.asksaveasfilename(defaultextension='.json', filetypes=[('JSON files','*.json')])
         if not path:
             return
+        threading.Thread(target=self._do_export, args=(self.selected_deck_id, path), daemon=True).start()
+
+    def _do_export(self, deck_id, path):
+        conn = open_conn()
         try:
-            self.model.export_deck_json(self.selected_deck_id, path)
-            messagebox.showinfo('Exported', 'Deck exported successfully')
+            Model(conn).export_deck_json(deck_id, path)
         except Exception as e:
-            messagebox.showerror('Error', str(e))
+            self.after(0, lambda err=str(e): messagebox.showerror('Error', err))
+        else:
+            self.after(0, lambda: messagebox.showinfo('Exported', 'Deck exported successfully'))
+        finally:
+            conn.close()
 
     def import_deck(self):
         path = filedialog.askopenfilename(filetypes=[('JSON files','*.json')])
         if not path:
             return
+        threading.Thread(target=self._do_import, args=(path,), daemon=True).start()
+
+    def _do_import(self, path):
+        conn = open_conn()
         try:
-            deck_id = self.model.import_deck_json(path)
-            messagebox.showinfo('Imported', 'Deck imported successfully')
-            self.load_decks()
+            Model(conn).import_deck_json(path)
         except Exception as e:
-            messagebox.showerror('Error', str(e))
+            self.after(0, lambda err=str(e): messagebox.showerror('Error', err))
+        else:
+            def done():
+                messagebox.showinfo('Imported', 'Deck imported successfully')
+                self.load_decks()
+            self.after(0, done)
+        finally:
+            conn.close()
 
 
     def start_study(self):
@@ -307,12 +546,14 @@ class App(tk.Tk):
             messagebox.showinfo('Info', 'Select a deck to study')
             return
 
-        cards = self.model.cards_in_deck(self.selected_deck_id)
+        cards = self.model.study_cards(self.selected_deck_id)
         if not cards:
             messagebox.showinfo('Info', 'Selected deck has no cards')
             return
 
-        self.study_queue = [{'id':c[0], 'front':c[1], 'back':c[2]} for c in cards]
+        # study_cards rows already support ['id']/['front']/['back']
+        # access; no need to copy them into dicts.
+        self.study_queue = cards
         StudyWindow(self, self.model)
 
 class StudyWindow(tk.Toplevel):
@@ -322,8 +563,14 @@ class StudyWindow(tk.Toplevel):
         self.geometry('600x400')
         self.parent = parent
         self.model = model
-        self.queue = parent.study_queue.copy()
+        self.queue = deque(parent.study_queue)
         self.current = None
+        self.pending = []
+        # The title-bar X and a Tcl-level teardown (parent window
+        # closing) both skip the Python destroy() override, so route the
+        # former through it and flush on <Destroy> for the latter.
+        self.protocol('WM_DELETE_WINDOW', self.destroy)
+        self.bind('<Destroy>', self._on_destroy)
 
         self.create_widgets()
         self.next_card()
@@ -344,7 +591,7 @@ class StudyWindow(tk.Toplevel):
             messagebox.showinfo('Done', 'You finished the queue!')
             self.destroy()
             return
-        self.current = self.queue.pop(0)
+        self.current = self.queue.popleft()
         self.front_lbl.config(text=self.current['front'] or '(empty)')
         self.back_shown = False
 
@@ -361,7 +608,7 @@ class StudyWindow(tk.Toplevel):
     def mark(self, correct):
         if not self.current:
             return
-        self.model.record_result(self.current['id'], correct)
+        self.pending.append((self.current['id'], correct))
         if correct:
 
             pass
@@ -370,6 +617,22 @@ class StudyWindow(tk.Toplevel):
             self.queue.append(self.current)
         self.next_card()
 
+    def flush_pending(self):
+        # Flush the buffered results in one transaction, whether the
+        # session finished or was closed early.
+        if self.pending:
+            self.model.record_results_bulk(self.pending)
+            self.pending = []
+
+    def _on_destroy(self, evt):
+        # <Destroy> fires once per child widget; only act on our own.
+        if evt.widget is self:
+            self.flush_pending()
+
+    def destroy(self):
+        self.flush_pending()
+        super().destroy()
+
 
 
 if __name__ == '__main__':